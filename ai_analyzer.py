@@ -1,8 +1,19 @@
-import openai
-from typing import Dict, List, Optional
-import json
+from openai import APIStatusError, OpenAI, RateLimitError
+import tiktoken
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+import logging
+import orjson
+import random
 import re
+import time
 from config import Config
+from llm_cache import DiskCache
+from semantic_cache import SemanticCache
+
+logger = logging.getLogger("digital_skeptic")
 
 
 class AIAnalysisError(Exception):
@@ -10,6 +21,77 @@ class AIAnalysisError(Exception):
     pass
 
 
+_NUMBERED_ITEM_RE = re.compile(r'^\d+\.\s*')
+
+# Token budgets for the article excerpt embedded in each prompt
+CONTENT_TOKENS = 750
+COUNTER_CONTENT_TOKENS = 625
+ENTITY_CONTENT_TOKENS = 500
+EXCERPT_BUDGETS = (CONTENT_TOKENS, COUNTER_CONTENT_TOKENS, ENTITY_CONTENT_TOKENS)
+
+# Client errors that are still worth retrying (timeout, conflict, rate limit)
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+SYSTEM_PROMPT = "You are an expert in critical thinking, journalism ethics, and media analysis. Provide precise, insightful analysis that helps users think critically about information."
+TEMPERATURE = 0.3  # Lower temperature for more consistent, analytical responses
+
+# JSON schema for the single-request analysis (Config.BATCH_ANALYSIS)
+ANALYSIS_SCHEMA = {
+    "name": "critical_analysis",
+    "strict": True,
+    "schema": {
+        "type": "object",
+        "properties": {
+            "core_claims": {"type": "array", "items": {"type": "string"}},
+            "language_analysis": {"type": "string"},
+            "red_flags": {"type": "array", "items": {"type": "string"}},
+            "verification_questions": {"type": "array", "items": {"type": "string"}},
+            "entities": {
+                "type": "object",
+                "properties": {
+                    "people": {"type": "array", "items": {"type": "string"}},
+                    "organizations": {"type": "array", "items": {"type": "string"}},
+                    "locations": {"type": "array", "items": {"type": "string"}}
+                },
+                "required": ["people", "organizations", "locations"],
+                "additionalProperties": False
+            },
+            "counter_argument": {"type": "string"}
+        },
+        "required": [
+            "core_claims", "language_analysis", "red_flags",
+            "verification_questions", "entities", "counter_argument"
+        ],
+        "additionalProperties": False
+    }
+}
+
+
+@lru_cache(maxsize=None)
+def _get_openai_client() -> OpenAI:
+    """Return the process-wide OpenAI client so its connection pool is shared."""
+    # Retries are handled by _get_ai_response, so disable the client's own
+    return OpenAI(api_key=Config.OPENAI_API_KEY, max_retries=0)
+
+
+@lru_cache(maxsize=None)
+def _get_encoding(model: str) -> Optional[tiktoken.Encoding]:
+    """
+    Return the model's tokenizer, or None when it cannot be loaded.
+
+    tiktoken downloads the BPE file on first use, which fails on an offline
+    or firewalled machine; excerpts then fall back to character slices.
+    """
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding('cl100k_base')
+    except Exception as e:
+        logger.debug("Tokenizer unavailable, trimming excerpts by characters: %s", e)
+        return None
+
+
 class DigitalSkepticAnalyzer:
     """
     Sophisticated AI analyzer that performs critical analysis of news articles.
@@ -20,8 +102,15 @@ class DigitalSkepticAnalyzer:
         if not Config.OPENAI_API_KEY:
             raise ValueError("OpenAI API key is required")
 
-        openai.api_key = Config.OPENAI_API_KEY
-        self.client = openai.OpenAI(api_key=Config.OPENAI_API_KEY)
+        self.client = _get_openai_client()
+        self.cache = DiskCache() if Config.LLM_CACHE_ENABLED else None
+        self.semantic_cache = SemanticCache() if Config.SEMANTIC_CACHE_ENABLED else None
+        self.task_cache = SemanticCache(
+            path=Config.TASK_CACHE_PATH,
+            threshold=Config.TASK_CACHE_THRESHOLD
+        ) if Config.TASK_CACHE_ENABLED else None
+
+        self._encoding = _get_encoding(Config.OPENAI_MODEL)
 
     def analyze_article(self, article_data: Dict[str, str]) -> Dict[str, any]:
         """
@@ -33,41 +122,165 @@ class DigitalSkepticAnalyzer:
         Returns:
             Dict[str, any]: Complete analysis results
         """
-        try:
+        metadata = {
+            'title': article_data.get('title', 'Unknown Title'),
+            'url': article_data.get('url', ''),
+            'authors': article_data.get('authors'),
+            'publish_date': article_data.get('publish_date')
+        }
+
+        # Tokenize once and share the trimmed excerpts across every prompt
+        article_data = {
+            **article_data,
+            '_excerpts': self._build_excerpts(article_data.get('content', ''))
+        }
+
+        # One embedding serves both the article-level and per-task caches;
+        # batch analysis bypasses the task cache, so it alone needs no vector
+        article_vector = None
+        if self.semantic_cache or (self.task_cache and not Config.BATCH_ANALYSIS):
+            article_vector = self._embed_article(article_data)
+
+        # Syndicated copies of the same story reuse the earlier analysis
+        if article_vector and self.semantic_cache:
+            cached = self.semantic_cache.search(article_vector)
+            if cached is not None:
+                return {**cached, 'article_metadata': metadata}
+
+        # Every sub-analysis is an independent, network-bound OpenAI request,
+        # so they are dispatched concurrently and the article's latency is
+        # bounded by the slowest prompt instead of the sum of all six.
+        tasks = {
             # Core analysis
-            core_claims = self._extract_core_claims(article_data)
-            language_analysis = self._analyze_language_and_tone(article_data)
-            red_flags = self._identify_red_flags(article_data)
-            verification_questions = self._generate_verification_questions(article_data)
+            'core_claims': self._extract_core_claims,
+            'language_analysis': self._analyze_language_and_tone,
+            'red_flags': self._identify_red_flags,
+            'verification_questions': self._generate_verification_questions,
 
             # Stand-out features
-            entities = self._perform_entity_recognition(article_data)
-            counter_argument = self._generate_counter_argument(article_data)
-
-            return {
-                'core_claims': core_claims,
-                'language_analysis': language_analysis,
-                'red_flags': red_flags,
-                'verification_questions': verification_questions,
-                'entities': entities,
-                'counter_argument': counter_argument,
-                'article_metadata': {
-                    'title': article_data.get('title', 'Unknown Title'),
-                    'url': article_data.get('url', ''),
-                    'authors': article_data.get('authors', 'Unknown Author'),
-                    'publish_date': article_data.get('publish_date', 'Unknown Date')
-                }
-            }
+            'entities': self._perform_entity_recognition,
+            'counter_argument': self._generate_counter_argument,
+        }
+
+        try:
+            if Config.BATCH_ANALYSIS:
+                results = self._analyze_all(article_data)
+            else:
+                results = self._run_tasks(tasks, article_data, article_vector)
 
         except Exception as e:
             raise AIAnalysisError(f"Analysis failed: {str(e)}")
 
+        if article_vector and self.semantic_cache:
+            self.semantic_cache.add(article_vector, results)
+
+        return {**results, 'article_metadata': metadata}
+
+    def _run_tasks(self, tasks: Dict[str, Callable], article_data: Dict[str, str],
+                   article_vector: Optional[List[float]]) -> Dict[str, any]:
+        """
+        Run the sub-analyses concurrently.
+
+        With the task cache enabled, a sub-analysis of a very similar article
+        from the same domain is reused, and only the remaining tasks are sent
+        to OpenAI.
+        """
+        results = {}
+        buckets = {}
+        if article_vector and self.task_cache:
+            domain = urlparse(article_data.get('url', '')).netloc.lower()
+            buckets = {name: f"{name}|{domain}" for name in tasks}
+            for name, bucket in buckets.items():
+                cached = self.task_cache.search(article_vector, bucket)
+                if cached is not None:
+                    results[name] = cached
+
+        pending = {name: task for name, task in tasks.items() if name not in results}
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = {
+                    name: executor.submit(task, article_data)
+                    for name, task in pending.items()
+                }
+                fresh = {name: future.result() for name, future in futures.items()}
+
+            results.update(fresh)
+            if buckets:
+                self.task_cache.add_many(
+                    article_vector,
+                    {buckets[name]: value for name, value in fresh.items()}
+                )
+
+        return {name: results[name] for name in tasks}
+
+    def _embed_article(self, article_data: Dict[str, str]) -> Optional[List[float]]:
+        """Embed the start of the article for similarity lookups; None if embedding fails."""
+        try:
+            response = self.client.embeddings.create(
+                model=Config.EMBEDDING_MODEL,
+                input=self._excerpt(article_data, ENTITY_CONTENT_TOKENS)
+            )
+            return SemanticCache.normalize(response.data[0].embedding)
+        except Exception as e:
+            # Embedding is an optimization only; fall back to a full analysis
+            logger.debug("Article embedding failed: %s", e)
+            return None
+
+    def _build_excerpts(self, content: str) -> Dict[int, str]:
+        """Encode the content once and decode the prefix for each token budget."""
+        if self._encoding is None:
+            # Roughly four characters per token
+            return {budget: content[:budget * 4] for budget in EXCERPT_BUDGETS}
+
+        # Article text is untrusted, so special-token strings are encoded as plain text
+        tokens = self._encoding.encode_ordinary(content)
+        return {budget: self._encoding.decode(tokens[:budget]) for budget in EXCERPT_BUDGETS}
+
+    def _excerpt(self, article_data: Dict[str, str], max_tokens: int) -> str:
+        """Return the article content trimmed to max_tokens tokens."""
+        excerpts = article_data.get('_excerpts') or self._build_excerpts(article_data.get('content', ''))
+        return excerpts[max_tokens]
+
+    def _analyze_all(self, article_data: Dict[str, str]) -> Dict[str, any]:
+        """Run every sub-analysis in one structured-output request, sending the article once."""
+        prompt = f"""You are an expert fact-checker, linguist, and journalism ethics educator. Perform a complete critical analysis of this news article.
+
+ARTICLE TITLE: {article_data.get('title', 'Unknown')}
+AUTHOR(S): {article_data.get('authors') or 'Unknown'}
+ARTICLE CONTENT: {self._excerpt(article_data, CONTENT_TOKENS)}
+
+Produce a JSON object with the following fields:
+
+1. core_claims: 3-5 of the most important FACTUAL CLAIMS (not opinions) that are specific, verifiable, and central to the article's narrative.
+
+2. language_analysis: A cohesive paragraph (2-3 sentences) assessing the tone (neutral, persuasive, sensationalist, academic, or opinion-based), notable language patterns (charged vs. neutral terms, certainty vs. hedging, superlatives), rhetorical techniques, and what the language suggests about the author's stance.
+
+3. red_flags: Specific signs of bias or poor reporting you can actually identify in the text - source issues (anonymous or one-sided sourcing, missing attribution), logical issues (correlation as causation, cherry-picked data), presentation issues (loaded language, opinion as fact), or transparency issues (vague timeframes, missing links to studies). Use an empty list if there are no significant red flags.
+
+4. verification_questions: 3-4 sharp, specific, actionable questions a reader could investigate to verify the article's most important or questionable claims. Avoid generic questions like "Is this source reliable?".
+
+5. entities: Key people, organizations, and locations worth investigating, each written as "Name - Investigation suggestion". Be selective - only include entities central to the claims, sources of quotes, funders of studies, or officials mentioned.
+
+6. counter_argument: A brief paragraph (3-4 sentences), starting with "An opposing perspective might argue that...", fairly presenting how someone with an opposing viewpoint might interpret or challenge the same information."""
+
+        try:
+            # Parsing doubles as validation, so an unparseable reply is not cached
+            response = self._get_ai_response(
+                prompt,
+                max_tokens=2500,
+                response_format={"type": "json_schema", "json_schema": ANALYSIS_SCHEMA},
+                validate=orjson.loads
+            )
+            return orjson.loads(response)
+        except orjson.JSONDecodeError as e:
+            raise AIAnalysisError(f"Model returned invalid JSON: {str(e)}")
+
     def _extract_core_claims(self, article_data: Dict[str, str]) -> List[str]:
         """Extract 3-5 main factual claims from the article."""
         prompt = f"""You are an expert fact-checker and critical thinking analyst. Your task is to identify the core factual claims in a news article.
 
 ARTICLE TITLE: {article_data.get('title', 'Unknown')}
-ARTICLE CONTENT: {article_data.get('content', '')[:3000]}
+ARTICLE CONTENT: {self._excerpt(article_data, CONTENT_TOKENS)}
 
 Instructions:
 1. Identify 3-5 of the most important FACTUAL CLAIMS (not opinions) made in this article
@@ -87,7 +300,7 @@ Example format:
 
 Your analysis:"""
 
-        response = self._get_ai_response(prompt)
+        response = self._get_ai_response(prompt, task='core_claims')
         return self._parse_bullet_points(response)
 
     def _analyze_language_and_tone(self, article_data: Dict[str, str]) -> str:
@@ -95,7 +308,7 @@ Your analysis:"""
         prompt = f"""You are a linguistics expert specializing in media analysis and bias detection. Analyze the language and tone of this news article.
 
 ARTICLE TITLE: {article_data.get('title', 'Unknown')}
-ARTICLE CONTENT: {article_data.get('content', '')[:3000]}
+ARTICLE CONTENT: {self._excerpt(article_data, CONTENT_TOKENS)}
 
 Provide a detailed analysis (2-3 sentences) that addresses:
 
@@ -116,14 +329,14 @@ Provide a detailed analysis (2-3 sentences) that addresses:
 
 Write a cohesive paragraph that synthesizes these observations into an overall assessment of the article's linguistic approach."""
 
-        return self._get_ai_response(prompt).strip()
+        return self._get_ai_response(prompt, task='language_analysis').strip()
 
     def _identify_red_flags(self, article_data: Dict[str, str]) -> List[str]:
         """Identify potential signs of bias or poor reporting."""
         prompt = f"""You are an experienced journalism ethics expert and media literacy educator. Analyze this article for potential red flags that indicate bias, poor reporting, or misleading information.
 
 ARTICLE TITLE: {article_data.get('title', 'Unknown')}
-ARTICLE CONTENT: {article_data.get('content', '')[:3000]}
+ARTICLE CONTENT: {self._excerpt(article_data, CONTENT_TOKENS)}
 
 Look for these specific red flags and ONLY list ones you can actually identify in the text:
 
@@ -153,9 +366,9 @@ TRANSPARENCY ISSUES:
 Format as bullet points starting with "• " and be specific about what you observed.
 If you cannot identify clear red flags, state "No significant red flags detected in the available content."""
 
-        response = self._get_ai_response(prompt)
+        response = self._get_ai_response(prompt, task='red_flags')
         if "no significant red flags detected" in response.lower():
-            return ["No significant red flags detected in the available content."]
+            return []
         return self._parse_bullet_points(response)
 
     def _generate_verification_questions(self, article_data: Dict[str, str]) -> List[str]:
@@ -163,8 +376,8 @@ If you cannot identify clear red flags, state "No significant red flags detected
         prompt = f"""You are a professional fact-checker and investigative journalist. Create specific, actionable questions that readers should ask to independently verify this article's content.
 
 ARTICLE TITLE: {article_data.get('title', 'Unknown')}
-ARTICLE CONTENT: {article_data.get('content', '')[:3000]}
-AUTHOR(S): {article_data.get('authors', 'Unknown')}
+ARTICLE CONTENT: {self._excerpt(article_data, CONTENT_TOKENS)}
+AUTHOR(S): {article_data.get('authors') or 'Unknown'}
 
 Create 3-4 sharp, specific verification questions that are:
 
@@ -184,14 +397,14 @@ Avoid generic questions like:
 
 Format as numbered questions (1., 2., 3., 4.)"""
 
-        response = self._get_ai_response(prompt)
+        response = self._get_ai_response(prompt, task='verification_questions')
         return self._parse_numbered_list(response)
 
     def _perform_entity_recognition(self, article_data: Dict[str, str]) -> Dict[str, List[str]]:
         """Identify key entities and suggest investigation points."""
         prompt = f"""You are an investigative researcher. Identify the key entities (people, organizations, locations) mentioned in this article and suggest what readers should investigate about them.
 
-ARTICLE CONTENT: {article_data.get('content', '')[:2000]}
+ARTICLE CONTENT: {self._excerpt(article_data, ENTITY_CONTENT_TOKENS)}
 
 For each significant entity mentioned, provide investigation suggestions. Focus on entities that are:
 - Central to the main claims
@@ -211,7 +424,7 @@ LOCATIONS (if relevant):
 
 Be selective - only include entities worth investigating, not every person/place mentioned."""
 
-        response = self._get_ai_response(prompt)
+        response = self._get_ai_response(prompt, task='entities')
         return self._parse_entity_response(response)
 
     def _generate_counter_argument(self, article_data: Dict[str, str]) -> str:
@@ -219,7 +432,7 @@ Be selective - only include entities worth investigating, not every person/place
         prompt = f"""You are playing devil's advocate. Read this article and then briefly summarize how someone with an opposing viewpoint might interpret or challenge the same information.
 
 ARTICLE TITLE: {article_data.get('title', 'Unknown')}
-ARTICLE CONTENT: {article_data.get('content', '')[:2500]}
+ARTICLE CONTENT: {self._excerpt(article_data, COUNTER_CONTENT_TOKENS)}
 
 Consider:
 1. What alternative explanations might exist for the events described?
@@ -231,27 +444,100 @@ Write a brief paragraph (3-4 sentences) presenting this alternative perspective.
 
 Start with: "An opposing perspective might argue that..."""
 
-        return self._get_ai_response(prompt).strip()
+        return self._get_ai_response(prompt, task='counter_argument').strip()
+
+    def _get_ai_response(self, prompt: str, task: Optional[str] = None, max_tokens: int = 1000,
+                         response_format: Optional[Dict[str, any]] = None,
+                         validate: Optional[Callable[[str], any]] = None) -> str:
+        """
+        Get response from OpenAI API with error handling and retries.
 
-    def _get_ai_response(self, prompt: str) -> str:
-        """Get response from OpenAI API with error handling and retries."""
+        The model is chosen per task from Config.MODEL_FOR, falling back to
+        Config.OPENAI_MODEL for tasks without a cheaper tier. A response is
+        only cached when the model finished normally, the content is not
+        empty, and validate (if given) accepts it without raising, so a
+        truncated or malformed reply is never replayed from the cache.
+        """
+        model = Config.MODEL_FOR.get(task, Config.OPENAI_MODEL)
+        options = {'response_format': response_format} if response_format else {}
+
+        if self.cache:
+            cache_key = DiskCache.make_key(
+                model, SYSTEM_PROMPT, prompt, TEMPERATURE, max_tokens,
+                orjson.dumps(response_format, option=orjson.OPT_SORT_KEYS).decode()
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        request = {
+            'model': model,
+            'messages': [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            'max_tokens': max_tokens,
+            'temperature': TEMPERATURE,
+            **options
+        }
+
+        content, finish_reason = self._request_completion(request)
+
+        if validate:
+            validate(content)
+        if self.cache and finish_reason == 'stop' and content:
+            self.cache.set(cache_key, content)
+        return content
+
+    def _request_completion(self, request: Dict[str, any]) -> Tuple[str, Optional[str]]:
+        """Send a chat completion with retries; return its content and finish reason."""
+        last_error = None
         for attempt in range(Config.MAX_RETRIES):
+            retry_after = None
             try:
-                response = self.client.chat.completions.create(
-                    model=Config.OPENAI_MODEL,
-                    messages=[
-                        {"role": "system", "content": "You are an expert in critical thinking, journalism ethics, and media analysis. Provide precise, insightful analysis that helps users think critically about information."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    max_tokens=1000,
-                    temperature=0.3  # Lower temperature for more consistent, analytical responses
-                )
-                return response.choices[0].message.content.strip()
+                response = self.client.chat.completions.create(**request)
+                choice = response.choices[0]
+                return (choice.message.content or '').strip(), choice.finish_reason
+
+            except RateLimitError as e:
+                last_error = e
+                retry_after = self._parse_retry_after(e.response)
+
+            except APIStatusError as e:
+                if e.status_code < 500 and e.status_code not in RETRYABLE_STATUS_CODES:
+                    raise AIAnalysisError(f"OpenAI rejected the request: {str(e)}")
+                last_error = e
+                retry_after = self._parse_retry_after(e.response)
 
             except Exception as e:
-                if attempt == Config.MAX_RETRIES - 1:
-                    raise AIAnalysisError(f"Failed to get AI response after {Config.MAX_RETRIES} attempts: {str(e)}")
-                continue
+                last_error = e
+
+            if attempt < Config.MAX_RETRIES - 1:
+                time.sleep(self._backoff_delay(attempt, retry_after))
+
+        raise AIAnalysisError(f"Failed to get AI response after {Config.MAX_RETRIES} attempts: {str(last_error)}")
+
+    @staticmethod
+    def _parse_retry_after(response) -> Optional[float]:
+        """Read the server's requested wait in seconds from Retry-After headers."""
+        headers = getattr(response, 'headers', None) or {}
+        try:
+            if headers.get('retry-after-ms'):
+                return float(headers['retry-after-ms']) / 1000
+            if headers.get('retry-after'):
+                return float(headers['retry-after'])
+        except ValueError:
+            pass  # HTTP-date form; fall back to exponential backoff
+        return None
+
+    @staticmethod
+    def _backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Exponential backoff with jitter, honoring the server's Retry-After but
+        never waiting longer than Config.RETRY_MAX_DELAY.
+        """
+        delay = max(Config.RETRY_BASE_DELAY * 2 ** attempt, retry_after or 0)
+        return min(delay, Config.RETRY_MAX_DELAY) + random.uniform(0, 0.5)
 
     def _parse_bullet_points(self, text: str) -> List[str]:
         """Parse bullet points from AI response."""
@@ -272,8 +558,9 @@ Start with: "An opposing perspective might argue that..."""
 
         for line in lines:
             line = line.strip()
-            if re.match(r'^\d+\.', line):
-                numbered_items.append(re.sub(r'^\d+\.\s*', '', line))
+            match = _NUMBERED_ITEM_RE.match(line)
+            if match:
+                numbered_items.append(line[match.end():])
 
         return numbered_items if numbered_items else [text.strip()]
 
@@ -1,28 +1,122 @@
+import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+import soupsieve as sv
 from newspaper import Article
 import re
+from functools import lru_cache
 from typing import Dict, Optional
+from urllib.parse import urlparse
 from config import Config
 
+logger = logging.getLogger("digital_skeptic")
+
 
 class ArticleScrapingError(Exception):
     """Custom exception for article scraping errors."""
     pass
 
 
+# Content cleaning patterns, compiled once at import
+_WHITESPACE_RE = re.compile(r'\s+')
+_JUNK_PATTERNS = (
+    r'Subscribe to.*?newsletter',
+    r'Follow us on.*?social media',
+    r'Copyright ©.*?rights reserved',
+    r'This article was originally published.*?',
+    r'Read more:.*?$'
+)
+# One pass for all junk text. The lookahead on the patterns' first letters
+# lets the regex engine skip non-candidate positions, which a bare
+# alternation cannot do, so this beats one pass per pattern.
+_JUNK_RE = re.compile(
+    '(?=[{}])(?:{})'.format(
+        ''.join(sorted({pattern[0].lower() for pattern in _JUNK_PATTERNS})),
+        '|'.join(_JUNK_PATTERNS)
+    ),
+    re.IGNORECASE | re.MULTILINE
+)
+
+
+# CSS selectors in priority order, compiled once at import
+_TITLE_SELECTORS = [
+    sv.compile(selector)
+    for selector in (
+        'h1.entry-title',
+        'h1.headline',
+        'h1.article-title',
+        '.headline h1',
+        'article h1',
+        'h1',
+        'title'
+    )
+]
+
+_CONTENT_SELECTOR_LIST = (
+    '.entry-content',
+    '.article-content',
+    '.post-content',
+    '.story-body',
+    'article .content',
+    '[data-module="ArticleBody"]',
+    '.article-body',
+    'main article',
+    'article'
+)
+_CONTENT_SELECTORS = [sv.compile(selector) for selector in _CONTENT_SELECTOR_LIST]
+_ANY_CONTENT_SELECTOR = sv.compile(', '.join(_CONTENT_SELECTOR_LIST))
+
+_AUTHOR_SELECTORS = [
+    sv.compile(selector)
+    for selector in (
+        '.author',
+        '.byline',
+        '[rel="author"]',
+        '.article-author',
+        '.post-author'
+    )
+]
+
+
+@lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    """Return the process-wide HTTP session so kept-alive connections are reused."""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': Config.USER_AGENT,
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+        'Accept-Language': 'en-US,en;q=0.5',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive',
+    })
+
+    # Pool kept-alive connections and retry transient failures with backoff.
+    # Retry-After is ignored because urllib3 sleeps for it uncapped, outside
+    # the request timeout, so one site could stall a batch worker for hours.
+    retry = Retry(
+        total=Config.MAX_RETRIES,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(['GET', 'HEAD']),
+        respect_retry_after_header=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=Config.HTTP_POOL_SIZE,
+        pool_maxsize=Config.HTTP_POOL_SIZE,
+        max_retries=retry
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
 class ArticleScraper:
     """Handles web scraping and content extraction from news article URLs."""
 
     def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': Config.USER_AGENT,
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-        })
+        self.session = _get_session()
 
     def extract_article(self, url: str) -> Dict[str, str]:
         """
@@ -37,49 +131,62 @@ class ArticleScraper:
         Raises:
             ArticleScrapingError: If article extraction fails
         """
+        # Download once and hand the same HTML to every extraction method
         try:
-            # Method 1: Try newspaper3k (most reliable for news articles)
-            article_data = self._extract_with_newspaper(url)
-            if article_data['content'] and len(article_data['content'].strip()) > 100:
-                return article_data
-
-        except Exception as e:
-            if Config.DEBUG_MODE:
-                print(f"Newspaper3k extraction failed: {e}")
+            response = self.session.get(url, timeout=10)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            raise ArticleScrapingError(f"Failed to download article from {url}: {e}")
+        html = response.content
+
+        if not self._prefers_beautifulsoup(url):
+            try:
+                # Method 1: Try newspaper3k (most reliable for news articles)
+                article_data = self._extract_with_newspaper(url, html)
+                if article_data['content'] and len(article_data['content'].strip()) > 100:
+                    return article_data
+
+            except Exception as e:
+                logger.debug("Newspaper3k extraction failed: %s", e)
 
         try:
             # Method 2: Fallback to custom BeautifulSoup extraction
-            article_data = self._extract_with_beautifulsoup(url)
+            article_data = self._extract_with_beautifulsoup(url, html)
             if article_data['content'] and len(article_data['content'].strip()) > 100:
                 return article_data
 
         except Exception as e:
-            if Config.DEBUG_MODE:
-                print(f"BeautifulSoup extraction failed: {e}")
+            logger.debug("BeautifulSoup extraction failed: %s", e)
 
         raise ArticleScrapingError(f"Failed to extract meaningful content from URL: {url}")
 
-    def _extract_with_newspaper(self, url: str) -> Dict[str, str]:
-        """Extract article using newspaper3k library."""
+    @staticmethod
+    def _prefers_beautifulsoup(url: str) -> bool:
+        """Check whether the URL's domain is configured to skip newspaper3k."""
+        host = urlparse(url).netloc.lower().split(':')[0]
+        return any(
+            host == domain or host.endswith('.' + domain)
+            for domain in Config.BEAUTIFULSOUP_DOMAINS
+        )
+
+    def _extract_with_newspaper(self, url: str, html: bytes) -> Dict[str, str]:
+        """Extract article using newspaper3k library from already-downloaded HTML."""
         article = Article(url)
-        article.download()
+        article.download(input_html=html)
         article.parse()
 
         return {
             'title': article.title or 'Unknown Title',
             'content': article.text or '',
-            'authors': ', '.join(article.authors) if article.authors else 'Unknown Author',
-            'publish_date': str(article.publish_date) if article.publish_date else 'Unknown Date',
+            'authors': ', '.join(article.authors) if article.authors else None,
+            'publish_date': str(article.publish_date) if article.publish_date else None,
             'url': url,
             'extraction_method': 'newspaper3k'
         }
 
-    def _extract_with_beautifulsoup(self, url: str) -> Dict[str, str]:
+    def _extract_with_beautifulsoup(self, url: str, html: bytes) -> Dict[str, str]:
         """Extract article using BeautifulSoup with custom selectors."""
-        response = self.session.get(url, timeout=10)
-        response.raise_for_status()
-
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
 
         # Extract title
         title = self._extract_title(soup)
@@ -94,7 +201,7 @@ class ArticleScraper:
             'title': title,
             'content': content,
             'authors': authors,
-            'publish_date': 'Unknown Date',
+            'publish_date': None,
             'url': url,
             'extraction_method': 'beautifulsoup'
         }
@@ -102,20 +209,11 @@ class ArticleScraper:
     def _extract_title(self, soup: BeautifulSoup) -> str:
         """Extract article title from HTML."""
         # Try multiple title selectors
-        selectors = [
-            'h1.entry-title',
-            'h1.headline',
-            'h1.article-title',
-            '.headline h1',
-            'article h1',
-            'h1',
-            'title'
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                return element.get_text().strip()
+        for selector in _TITLE_SELECTORS:
+            element = selector.select_one(soup)
+            text = element.get_text().strip() if element else ''
+            if text:
+                return text
 
         return 'Unknown Title'
 
@@ -125,65 +223,41 @@ class ArticleScraper:
         for element in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
             element.decompose()
 
-        # Try multiple content selectors
-        selectors = [
-            '.entry-content',
-            '.article-content',
-            '.post-content',
-            '.story-body',
-            'article .content',
-            '[data-module="ArticleBody"]',
-            '.article-body',
-            'main article',
-            'article'
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element:
-                content = element.get_text(separator=' ', strip=True)
-                if len(content) > 200:  # Ensure we have substantial content
-                    return self._clean_content(content)
+        # Collect the first match of every selector in a single walk of the tree
+        first_matches = {}
+        for element in _ANY_CONTENT_SELECTOR.select(soup):
+            for priority, selector in enumerate(_CONTENT_SELECTORS):
+                if priority not in first_matches and selector.match(element):
+                    first_matches[priority] = element
+
+        for priority in sorted(first_matches):
+            content = ' '.join(first_matches[priority].stripped_strings)
+            if len(content) > 200:  # Ensure we have substantial content
+                return self._clean_content(content)
 
         # Fallback: extract all paragraph text
         paragraphs = soup.find_all('p')
         content = ' '.join([p.get_text(strip=True) for p in paragraphs])
         return self._clean_content(content)
 
-    def _extract_authors(self, soup: BeautifulSoup) -> str:
+    def _extract_authors(self, soup: BeautifulSoup) -> Optional[str]:
         """Extract author information from HTML."""
         # Try multiple author selectors
-        selectors = [
-            '.author',
-            '.byline',
-            '[rel="author"]',
-            '.article-author',
-            '.post-author'
-        ]
-
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                return element.get_text().strip()
+        for selector in _AUTHOR_SELECTORS:
+            element = selector.select_one(soup)
+            text = element.get_text().strip() if element else ''
+            if text:
+                return text
 
-        return 'Unknown Author'
+        return None
 
     def _clean_content(self, content: str) -> str:
         """Clean and normalize article content."""
         # Remove extra whitespace
-        content = re.sub(r'\s+', ' ', content)
+        content = _WHITESPACE_RE.sub(' ', content)
 
         # Remove common junk text
-        junk_patterns = [
-            r'Subscribe to.*?newsletter',
-            r'Follow us on.*?social media',
-            r'Copyright ©.*?rights reserved',
-            r'This article was originally published.*?',
-            r'Read more:.*?$'
-        ]
-
-        for pattern in junk_patterns:
-            content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.MULTILINE)
+        content = _JUNK_RE.sub('', content)
 
         # Truncate if too long
         if len(content) > Config.MAX_ARTICLE_LENGTH:
@@ -10,14 +10,53 @@ class Config:
     # OpenAI Configuration
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
     OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-4')
+    OPENAI_FAST_MODEL = os.getenv('OPENAI_FAST_MODEL', 'gpt-4o-mini')
+
+    # Sub-analyses that don't need the primary model's reasoning; others use OPENAI_MODEL
+    MODEL_FOR = {
+        'verification_questions': OPENAI_FAST_MODEL,
+        'entities': OPENAI_FAST_MODEL,
+        'counter_argument': OPENAI_FAST_MODEL,
+    }
 
     # Analysis Configuration
     MAX_ARTICLE_LENGTH = 10000  # Maximum characters to analyze
     MAX_RETRIES = 3  # Maximum retry attempts for failed requests
+    RETRY_BASE_DELAY = 1.0  # Seconds before the first retry, doubled on each attempt
+    RETRY_MAX_DELAY = 30.0  # Upper bound for any retry wait, including Retry-After
+    MAX_CONCURRENCY = int(os.getenv('MAX_CONCURRENCY', '4'))  # Articles processed in parallel
+    HTTP_POOL_SIZE = 32  # Kept-alive connections per host for article fetching
+
+    # Send all six sub-analyses in one structured-output request instead of
+    # six separate prompts. Requires a model with JSON schema support (e.g. gpt-4o).
+    BATCH_ANALYSIS = os.getenv('BATCH_ANALYSIS', 'false').lower() == 'true'
+
+    # Response Cache Configuration
+    LLM_CACHE_ENABLED = os.getenv('LLM_CACHE_ENABLED', 'true').lower() == 'true'
+    LLM_CACHE_DIR = os.getenv('LLM_CACHE_DIR', '.llm_cache')
+    CACHE_TTL = int(os.getenv('CACHE_TTL', '86400'))  # Seconds; 0 disables expiry
+
+    # Semantic Cache Configuration (reuses analyses of near-duplicate articles)
+    SEMANTIC_CACHE_ENABLED = os.getenv('SEMANTIC_CACHE_ENABLED', 'false').lower() == 'true'
+    SEMANTIC_CACHE_PATH = os.getenv('SEMANTIC_CACHE_PATH', '.llm_cache/semantic_index.json')
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv('SEMANTIC_CACHE_THRESHOLD', '0.93'))
+    EMBEDDING_MODEL = os.getenv('EMBEDDING_MODEL', 'text-embedding-3-small')
+
+    # Per-task cache: reuses individual sub-analyses of similar articles from the same domain
+    TASK_CACHE_ENABLED = os.getenv('TASK_CACHE_ENABLED', 'false').lower() == 'true'
+    TASK_CACHE_PATH = os.getenv('TASK_CACHE_PATH', '.llm_cache/task_index.json')
+    TASK_CACHE_THRESHOLD = float(os.getenv('TASK_CACHE_THRESHOLD', '0.95'))
 
     # Debug Configuration
     DEBUG_MODE = os.getenv('DEBUG_MODE', 'false').lower() == 'true'
 
+    # Domains whose pages extract better with BeautifulSoup; newspaper3k is skipped
+    BEAUTIFULSOUP_DOMAINS = [
+        domain.strip().lower()
+        for domain in os.getenv('BEAUTIFULSOUP_DOMAINS', '').split(',')
+        if domain.strip()
+    ]
+
     # User Agent for web scraping
     USER_AGENT = (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
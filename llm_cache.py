@@ -0,0 +1,66 @@
+import hashlib
+import logging
+import orjson
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from config import Config
+
+logger = logging.getLogger("digital_skeptic")
+
+
+class DiskCache:
+    """
+    Persistent cache of LLM responses keyed by a SHA-256 of the request.
+    Each entry is stored as its own JSON file, so concurrent analyses can
+    read and write without sharing a single index file.
+    """
+
+    def __init__(self, directory: Optional[str] = None, ttl: Optional[int] = None):
+        self.directory = Path(directory or Config.LLM_CACHE_DIR)
+        self.ttl = Config.CACHE_TTL if ttl is None else ttl
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(*parts) -> str:
+        """Build a cache key from every request field that affects the response."""
+        return hashlib.sha256("\0".join(str(part) for part in parts).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response for key, or None on a miss or expired entry."""
+        value = None
+        try:
+            with open(self._path(key), 'rb') as f:
+                entry = orjson.loads(f.read())
+            if not self.ttl or time.time() - entry['created'] < self.ttl:
+                value = entry['value']
+        except (OSError, ValueError, KeyError):
+            pass
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: str):
+        """Store a response, writing atomically so readers never see partial files."""
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps({'created': time.time(), 'value': value}))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # A cache that cannot be written must never fail the analysis
+            logger.debug("LLM cache write failed: %s", e)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
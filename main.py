@@ -9,7 +9,9 @@ to help users think critically about information they consume.
 
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import List
 
 from article_scraper import ArticleScraper, ArticleScrapingError
 from ai_analyzer import DigitalSkepticAnalyzer, AIAnalysisError
@@ -17,6 +19,53 @@ from report_generator import ReportGenerator, ConsoleReporter
 from config import Config
 
 
+def read_urls(urls_file: str) -> List[str]:
+    """Read article URLs from a file, one per line, skipping blanks and # comments."""
+    with open(urls_file, 'r', encoding='utf-8') as f:
+        lines = (line.strip() for line in f)
+        return [line for line in lines if line and not line.startswith('#')]
+
+
+def run_batch(urls: List[str], output_dir: Path, scraper: ArticleScraper,
+              analyzer: DigitalSkepticAnalyzer, generator: ReportGenerator) -> int:
+    """
+    Analyze several articles concurrently, writing one report per URL.
+
+    At most Config.MAX_CONCURRENCY articles are in flight at once to stay
+    within OpenAI rate limits. A failure on one URL is reported and does
+    not abort the rest of the batch.
+
+    Returns:
+        int: Number of URLs that failed
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    def process(index: int, url: str) -> bool:
+        try:
+            article_data = scraper.extract_article(url)
+            analysis_results = analyzer.analyze_article(article_data)
+            output_path = output_dir / f"critical_analysis_report_{index}.md"
+            with open(output_path, 'w', encoding='utf-8') as f:
+                generator.write_report(analysis_results, f)
+
+            ConsoleReporter.print_success(f"{url} -> {output_path}")
+            return True
+
+        except (ArticleScrapingError, AIAnalysisError) as e:
+            ConsoleReporter.print_error(f"{url}: {str(e)}")
+        except Exception as e:
+            ConsoleReporter.print_error(f"{url}: Unexpected error: {str(e)}")
+            if Config.DEBUG_MODE:
+                import traceback
+                traceback.print_exc()
+        return False
+
+    with ThreadPoolExecutor(max_workers=Config.MAX_CONCURRENCY) as executor:
+        results = list(executor.map(process, range(1, len(urls) + 1), urls))
+
+    return results.count(False)
+
+
 def main():
     """Main execution function."""
     parser = argparse.ArgumentParser(
@@ -27,20 +76,39 @@ Examples:
   python main.py https://example.com/news-article
   python main.py https://example.com/news-article --output report.md
   python main.py https://example.com/news-article --debug
+  python main.py --urls-file urls.txt --output-dir reports/
         """
     )
 
     parser.add_argument(
         'url',
+        nargs='?',
         help='URL of the news article to analyze'
     )
 
+    parser.add_argument(
+        '--urls-file',
+        help='File with one article URL per line to analyze as a batch'
+    )
+
+    parser.add_argument(
+        '--output-dir',
+        default='reports',
+        help='Directory for batch reports when using --urls-file (default: reports)'
+    )
+
     parser.add_argument(
         '--output', '-o',
         default='critical_analysis_report.md',
         help='Output file path for the analysis report (default: critical_analysis_report.md)'
     )
 
+    parser.add_argument(
+        '--quiet', '-q',
+        action='store_true',
+        help='Only print errors'
+    )
+
     parser.add_argument(
         '--debug',
         action='store_true',
@@ -49,10 +117,15 @@ Examples:
 
     args = parser.parse_args()
 
+    if bool(args.url) == bool(args.urls_file):
+        parser.error('provide either a URL or --urls-file')
+
     # Set debug mode if requested
     if args.debug:
         Config.DEBUG_MODE = True
 
+    ConsoleReporter.configure(quiet=args.quiet, debug=Config.DEBUG_MODE)
+
     # Validate configuration
     try:
         Config.validate()
@@ -69,6 +142,15 @@ Examples:
         analyzer = DigitalSkepticAnalyzer()
         generator = ReportGenerator()
 
+        if args.urls_file:
+            urls = read_urls(args.urls_file)
+            ConsoleReporter.print_progress(f"Analyzing {len(urls)} articles...")
+            failures = run_batch(urls, Path(args.output_dir), scraper, analyzer, generator)
+            ConsoleReporter.print_progress(
+                f"Batch complete: {len(urls) - failures} succeeded, {failures} failed"
+            )
+            return 1 if failures else 0
+
         # Extract article content
         ConsoleReporter.print_progress(f"Extracting content from: {args.url}")
         article_data = scraper.extract_article(args.url)
@@ -80,6 +162,11 @@ Examples:
         ConsoleReporter.print_progress("Performing critical analysis...")
         analysis_results = analyzer.analyze_article(article_data)
 
+        if Config.DEBUG_MODE and analyzer.cache:
+            ConsoleReporter.print_progress(
+                f"LLM cache: {analyzer.cache.hits} hits, {analyzer.cache.misses} misses"
+            )
+
         # Generate report
         ConsoleReporter.print_progress("Generating analysis report...")
         report = generator.generate_report(analysis_results)
@@ -93,11 +180,12 @@ Examples:
         ConsoleReporter.print_success(f"Critical analysis report saved to: {output_path.absolute()}")
 
         # Display preview of report
-        print("\n" + "="*60)
-        print("REPORT PREVIEW")
-        print("="*60)
-        print(report[:500] + "..." if len(report) > 500 else report)
-        print("="*60)
+        if not args.quiet:
+            print("\n" + "="*60)
+            print("REPORT PREVIEW")
+            print("="*60)
+            print(report[:500] + "..." if len(report) > 500 else report)
+            print("="*60)
 
         return 0
 
@@ -1,7 +1,101 @@
-from typing import Dict, List
+import logging
+import sys
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, TextIO
 from datetime import datetime
 
+logger = logging.getLogger("digital_skeptic")
 
+
+# Static report text, built once at import instead of on every report
+# Header title when the article has none; author and date lines are simply omitted
+_UNKNOWN_TITLE = 'Unknown Article'
+
+_REPORT_DISCLAIMER = "*This report provides a critical analysis to help readers evaluate the article's claims, sources, and potential biases. It does not determine truth or falsehood, but rather highlights areas that warrant further investigation.*"
+
+# Section headings are interned so every report (and every section built
+# from them) shares one string object per heading
+_H_CORE = sys.intern("### Core Claims\n\n")
+_H_LANGUAGE = sys.intern("### Language & Tone Analysis\n\n")
+_H_RED = sys.intern("### Potential Red Flags\n\n")
+_H_VERIFICATION = sys.intern("### Verification Questions\n\n")
+_H_ENTITY = sys.intern("### Entity Investigation Guide\n\n")
+_H_COUNTER = sys.intern("### Alternative Perspective\n\n")
+
+_CORE_CLAIMS_HEADER = _H_CORE + "*The following are the main factual assertions made in this article:*\n\n"
+_NO_CLAIMS = _H_CORE + "*No specific factual claims could be identified in the available content.*"
+
+_NO_LANGUAGE_ANALYSIS = _H_LANGUAGE + "*Unable to perform language analysis on the available content.*"
+
+_RED_FLAGS_INTRO = _H_RED + "*The following potential issues were identified that may indicate bias or require additional verification:*\n\n"
+_NO_RED_FLAGS = _H_RED + "*No significant red flags detected in the available content. However, readers should still verify information through independent sources.*"
+
+_VERIFICATION_INTRO = _H_VERIFICATION + "*Consider investigating these specific questions to verify the article's content:*\n\n"
+_NO_QUESTIONS = _H_VERIFICATION + "*Unable to generate specific verification questions for this content.*"
+
+_ENTITY_INTRO = _H_ENTITY + "*Key entities mentioned in the article and suggested investigation points:*\n\n"
+
+# Entity categories produced by the analyzer, rendered by the unrolled builder
+_ENTITY_CATEGORIES = frozenset(('people', 'organizations', 'locations'))
+_PEOPLE_HEADING = "**PEOPLE:**\n"
+_ORGANIZATIONS_HEADING = "**ORGANIZATIONS:**\n"
+_LOCATIONS_HEADING = "**LOCATIONS:**\n"
+
+_COUNTER_INTRO = _H_COUNTER + "*To highlight potential biases, consider this opposing viewpoint:*\n\n"
+
+_FOOTER = """---
+
+### How to Use This Analysis
+
+This critical analysis is designed to enhance your media literacy, not replace your judgment. Use it to:
+
+• **Question assumptions** - Look beyond surface-level claims
+• **Seek additional sources** - Cross-reference with other reputable outlets
+• **Investigate entities** - Research the background of people and organizations mentioned
+• **Consider context** - Look for information that might be missing
+• **Think critically** - Form your own conclusions based on evidence
+
+*Remember: The goal is not to dismiss information, but to evaluate it more thoughtfully.*"""
+
+
+_TIMESTAMP_FORMAT = '%B %d, %Y at %I:%M %p'
+_timestamp_cache = (None, '')
+
+
+def _report_timestamp() -> str:
+    """Current time in the header format, reformatted only when the minute changes."""
+    global _timestamp_cache
+    minute = int(time.time() // 60)
+    cached_minute, formatted = _timestamp_cache
+    if cached_minute != minute:
+        formatted = datetime.now().strftime(_TIMESTAMP_FORMAT)
+        _timestamp_cache = (minute, formatted)
+    return formatted
+
+
+@lru_cache(maxsize=32)
+def _category_heading(category: str) -> str:
+    """Bold, uppercased entity category heading; the category set is small and fixed."""
+    return f"**{category.upper()}:**\n"
+
+
+_BANNER = "=" * 60
+_ARTICLE_INFO_TEMPLATE = (
+    f"\n{_BANNER}\n"
+    "ARTICLE INFORMATION\n"
+    f"{_BANNER}\n"
+    "Title: %s\n"
+    "Author(s): %s\n"
+    "URL: %s\n"
+    "Content Length: %d characters\n"
+    "Extraction Method: %s\n"
+    f"{_BANNER}\n"
+)
+
+
+# Locals below are annotated with builtin types so that a Cython build
+# (see setup.py) compiles them as typed variables; plain Python ignores them.
 class ReportGenerator:
     """Generates professional Markdown reports from analysis results."""
 
@@ -15,166 +109,198 @@ class ReportGenerator:
         Returns:
             str: Formatted Markdown report
         """
-        metadata = analysis_results.get('article_metadata', {})
-        title = metadata.get('title', 'Unknown Article')
-
-        # Build the report sections
-        report_sections = [
-            self._generate_header(metadata),
-            self._generate_core_claims(analysis_results.get('core_claims', [])),
-            self._generate_language_analysis(analysis_results.get('language_analysis', '')),
-            self._generate_red_flags(analysis_results.get('red_flags', [])),
-            self._generate_verification_questions(analysis_results.get('verification_questions', [])),
-            self._generate_entity_investigation(analysis_results.get('entities', {})),
-            self._generate_counter_argument(analysis_results.get('counter_argument', '')),
-            self._generate_footer()
-        ]
-
-        return '\n\n'.join(filter(None, report_sections))
-
-    def _generate_header(self, metadata: Dict[str, str]) -> str:
-        """Generate report header with article metadata."""
-        title = metadata.get('title', 'Unknown Article')
-        url = metadata.get('url', '')
-        authors = metadata.get('authors', 'Unknown Author')
-        publish_date = metadata.get('publish_date', 'Unknown Date')
+        return ''.join(self._report_parts(analysis_results))
 
-        header = f"# Critical Analysis Report: {title}\n"
+    def write_report(self, analysis_results: Dict[str, any], stream: TextIO):
+        """
+        Write the report section by section to a text stream (e.g. an open file)
+        without first assembling the whole report as one string.
 
-        if url:
-            header += f"**Source URL:** {url}\n"
-        if authors != 'Unknown Author':
-            header += f"**Author(s):** {authors}\n"
-        if publish_date != 'Unknown Date':
-            header += f"**Published:** {publish_date}\n"
+        Args:
+            analysis_results (Dict[str, any]): Results from DigitalSkepticAnalyzer
+            stream (TextIO): Destination for the Markdown report
+        """
+        stream.writelines(self._report_parts(analysis_results))
 
-        header += f"**Analysis Generated:** {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\n"
-        header += "---\n"
-        header += "*This report provides a critical analysis to help readers evaluate the article's claims, sources, and potential biases. It does not determine truth or falsehood, but rather highlights areas that warrant further investigation.*"
+    def _report_parts(self, analysis_results: Dict[str, any]) -> tuple:
+        """
+        Lay out the report as a flat sequence of sections and separators.
+        Both generate_report and write_report emit exactly this sequence, so
+        file reports and single-URL reports cannot drift apart.
+        """
+        header, claims, language, red_flags, questions, entity_guide, counter, footer = \
+            self._build_sections(analysis_results)
+        # The optional sections carry their own separator or are empty
+        return (header, '\n\n', claims, '\n\n', language, '\n\n', red_flags, '\n\n',
+                questions, entity_guide, counter, '\n\n', footer)
 
-        return header
+    def _build_sections(self, analysis_results: Dict[str, any]) -> tuple:
+        """
+        Render the report sections in order. The stand-out sections (entity
+        guide and counter-argument) are prefixed with their "\\n\\n" separator,
+        or are empty strings when there is nothing to show.
+        """
+        metadata = analysis_results.get('article_metadata', {})
+        # Optional fields are None when unknown, so the header tests truthiness
+        title = metadata.get('title') or _UNKNOWN_TITLE
+        url = metadata.get('url')
+        authors = metadata.get('authors')
+        publish_date = metadata.get('publish_date')
+
+        # These sections always render; absent results (including the empty
+        # red flag list the analyzer returns when it finds none) use the
+        # cached placeholder, so the builders only handle non-empty input
+        claims = analysis_results.get('core_claims')
+        language_analysis = analysis_results.get('language_analysis')
+        red_flags = analysis_results.get('red_flags')
+        questions = analysis_results.get('verification_questions')
+
+        entity_guide: str = ""
+        if entities := analysis_results.get('entities'):
+            if guide := self._generate_entity_investigation(entities):
+                entity_guide = "\n\n" + guide
+        counter: str = ""
+        if counter_argument := analysis_results.get('counter_argument'):
+            counter = "\n\n" + self._generate_counter_argument(counter_argument)
+
+        return (
+            self._generate_header(title, url, authors, publish_date),
+            self._generate_core_claims(claims) if claims else _NO_CLAIMS,
+            self._generate_language_analysis(language_analysis) if language_analysis else _NO_LANGUAGE_ANALYSIS,
+            self._generate_red_flags(red_flags) if red_flags else _NO_RED_FLAGS,
+            self._generate_verification_questions(questions) if questions else _NO_QUESTIONS,
+            entity_guide,
+            counter,
+            self._generate_footer(),
+        )
+
+    def _generate_header(self, title: str, url: Optional[str], authors: Optional[str],
+                         publish_date: Optional[str]) -> str:
+        """Generate report header with article metadata."""
+        lines: list = [f"# Critical Analysis Report: {title}"]
 
-    def _generate_core_claims(self, claims: List[str]) -> str:
-        """Generate Core Claims section."""
-        if not claims:
-            return "### Core Claims\n\n*No specific factual claims could be identified in the available content.*"
+        if url:
+            lines.append(f"**Source URL:** {url}")
+        if authors:
+            lines.append(f"**Author(s):** {authors}")
+        if publish_date:
+            lines.append(f"**Published:** {publish_date}")
 
-        section = "### Core Claims\n\n"
-        section += "*The following are the main factual assertions made in this article:*\n\n"
+        lines.append(f"**Analysis Generated:** {_report_timestamp()}")
+        lines.append("---")
+        lines.append(_REPORT_DISCLAIMER)
 
-        for claim in claims:
-            section += f"• {claim}\n"
+        return "\n".join(lines)
 
-        return section
+    def _generate_core_claims(self, claims: List[str]) -> str:
+        """Generate Core Claims section from a non-empty list of claims."""
+        bullets: str = "\n".join(f"• {claim}" for claim in claims)
+        return f"{_CORE_CLAIMS_HEADER}{bullets}\n"
 
     def _generate_language_analysis(self, analysis: str) -> str:
-        """Generate Language & Tone Analysis section."""
-        if not analysis:
-            return "### Language & Tone Analysis\n\n*Unable to perform language analysis on the available content.*"
-
-        section = "### Language & Tone Analysis\n\n"
-        section += analysis
-
-        return section
+        """Generate Language & Tone Analysis section from a non-empty analysis."""
+        return _H_LANGUAGE + analysis
 
     def _generate_red_flags(self, red_flags: List[str]) -> str:
-        """Generate Potential Red Flags section."""
-        section = "### Potential Red Flags\n\n"
-
-        if not red_flags or (len(red_flags) == 1 and "no significant red flags detected" in red_flags[0].lower()):
-            section += "*No significant red flags detected in the available content. However, readers should still verify information through independent sources.*"
-            return section
-
-        section += "*The following potential issues were identified that may indicate bias or require additional verification:*\n\n"
-
-        for flag in red_flags:
-            section += f"• {flag}\n"
-
-        return section
+        """Generate Potential Red Flags section from a non-empty list of flags."""
+        bullets: str = "\n".join(f"• {flag}" for flag in red_flags)
+        return f"{_RED_FLAGS_INTRO}{bullets}\n"
 
     def _generate_verification_questions(self, questions: List[str]) -> str:
-        """Generate Verification Questions section."""
-        if not questions:
-            return "### Verification Questions\n\n*Unable to generate specific verification questions for this content.*"
-
-        section = "### Verification Questions\n\n"
-        section += "*Consider investigating these specific questions to verify the article's content:*\n\n"
-
-        for i, question in enumerate(questions, 1):
-            section += f"{i}. {question}\n"
-
-        return section
+        """Generate Verification Questions section from a non-empty list of questions."""
+        numbered: str = "\n".join(f"{i}. {question}" for i, question in enumerate(questions, 1))
+        return f"{_VERIFICATION_INTRO}{numbered}\n"
 
     def _generate_entity_investigation(self, entities: Dict[str, List[str]]) -> str:
         """Generate Entity Investigation Guide (stand-out feature)."""
-        if not any(entities.values()):
+        if entities.keys() == _ENTITY_CATEGORIES:
+            return self._generate_entity_investigation_fixed(
+                entities['people'], entities['organizations'], entities['locations']
+            )
+
+        # Built in a single pass; no non-empty category means no section
+        categories: str = "\n\n".join(
+            _category_heading(category) + "\n".join(f"• {entity}" for entity in entity_list)
+            for category, entity_list in entities.items()
+            if entity_list
+        )
+        if not categories:
             return ""
 
-        section = "### Entity Investigation Guide\n\n"
-        section += "*Key entities mentioned in the article and suggested investigation points:*\n\n"
-
-        for category, entity_list in entities.items():
-            if entity_list:
-                section += f"**{category.upper()}:**\n"
-                for entity in entity_list:
-                    section += f"• {entity}\n"
-                section += "\n"
+        return f"{_ENTITY_INTRO}{categories}"
 
-        return section.rstrip()
+    def _generate_entity_investigation_fixed(self, people: List[str], organizations: List[str],
+                                             locations: List[str]) -> str:
+        """Entity guide unrolled for the analyzer's people/organizations/locations schema."""
+        categories: list = []
+        if people:
+            categories.append(_PEOPLE_HEADING + "\n".join(f"• {entity}" for entity in people))
+        if organizations:
+            categories.append(_ORGANIZATIONS_HEADING + "\n".join(f"• {entity}" for entity in organizations))
+        if locations:
+            categories.append(_LOCATIONS_HEADING + "\n".join(f"• {entity}" for entity in locations))
 
-    def _generate_counter_argument(self, counter_argument: str) -> str:
-        """Generate Counter-Perspective section (stand-out feature)."""
-        if not counter_argument:
+        if not categories:
             return ""
 
-        section = "### Alternative Perspective\n\n"
-        section += "*To highlight potential biases, consider this opposing viewpoint:*\n\n"
-        section += f"> {counter_argument}"
+        return _ENTITY_INTRO + "\n\n".join(categories)
 
-        return section
+    def _generate_counter_argument(self, counter_argument: str) -> str:
+        """Generate Counter-Perspective section (stand-out feature) from a non-empty argument."""
+        return f"{_COUNTER_INTRO}> {counter_argument}"
 
     def _generate_footer(self) -> str:
         """Generate report footer with usage instructions."""
-        footer = "---\n\n"
-        footer += "### How to Use This Analysis\n\n"
-        footer += "This critical analysis is designed to enhance your media literacy, not replace your judgment. Use it to:\n\n"
-        footer += "• **Question assumptions** - Look beyond surface-level claims\n"
-        footer += "• **Seek additional sources** - Cross-reference with other reputable outlets\n"
-        footer += "• **Investigate entities** - Research the background of people and organizations mentioned\n"
-        footer += "• **Consider context** - Look for information that might be missing\n"
-        footer += "• **Think critically** - Form your own conclusions based on evidence\n\n"
-        footer += "*Remember: The goal is not to dismiss information, but to evaluate it more thoughtfully.*"
-
-        return footer
+        return _FOOTER
 
 
 class ConsoleReporter:
-    """Handles console output and progress reporting."""
+    """
+    Handles console output and progress reporting.
+
+    Messages go through the "digital_skeptic" logger with %-style arguments,
+    so nothing is formatted when the level is filtered out (e.g. --quiet).
+    """
+
+    @staticmethod
+    def configure(quiet: bool = False, debug: bool = False):
+        """
+        Print reporter messages to stdout. Quiet mode shows errors only;
+        debug mode also shows the debug messages logged by the other modules.
+        """
+        if not logger.handlers:
+            handler = logging.StreamHandler(sys.stdout)
+            handler.setFormatter(logging.Formatter('%(message)s'))
+            logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG if debug else logging.ERROR if quiet else logging.INFO)
+        logger.propagate = False
 
     @staticmethod
     def print_progress(message: str):
         """Print progress message to console."""
-        print(f"[DIGITAL SKEPTIC] {message}")
+        logger.info("[DIGITAL SKEPTIC] %s", message)
 
     @staticmethod
     def print_error(error_message: str):
         """Print error message to console."""
-        print(f"[ERROR] {error_message}")
+        logger.error("[ERROR] %s", error_message)
 
     @staticmethod
     def print_success(message: str):
         """Print success message to console."""
-        print(f"[SUCCESS] {message}")
+        logger.info("[SUCCESS] %s", message)
 
     @staticmethod
     def print_article_info(article_data: Dict[str, str]):
         """Print extracted article information."""
-        print("\n" + "="*60)
-        print("ARTICLE INFORMATION")
-        print("="*60)
-        print(f"Title: {article_data.get('title', 'Unknown')}")
-        print(f"Author(s): {article_data.get('authors', 'Unknown')}")
-        print(f"URL: {article_data.get('url', 'Unknown')}")
-        print(f"Content Length: {len(article_data.get('content', ''))} characters")
-        print(f"Extraction Method: {article_data.get('extraction_method', 'Unknown')}")
-        print("="*60 + "\n")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        logger.info(
+            _ARTICLE_INFO_TEMPLATE,
+            article_data.get('title', 'Unknown'),
+            article_data.get('authors') or 'Unknown',
+            article_data.get('url', 'Unknown'),
+            len(article_data.get('content', '')),
+            article_data.get('extraction_method', 'Unknown')
+        )
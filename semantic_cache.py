@@ -0,0 +1,89 @@
+import logging
+import math
+import orjson
+import os
+import tempfile
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+from config import Config
+
+logger = logging.getLogger("digital_skeptic")
+
+DEFAULT_BUCKET = 'analysis'
+
+
+class SemanticCache:
+    """
+    Similarity cache of analyses keyed by article embedding.
+
+    Articles are stored as L2-normalized embedding vectors, so a dot product
+    is their cosine similarity. Each vector holds one value per bucket (the
+    complete analysis, or a single sub-analysis for a given task and domain).
+    Lookups are an exact linear scan, which is the same search a flat
+    inner-product index performs and is fast enough for the few thousand
+    articles a local cache accumulates.
+    """
+
+    def __init__(self, path: Optional[str] = None, threshold: Optional[float] = None):
+        self.path = Path(path or Config.SEMANTIC_CACHE_PATH)
+        self.threshold = Config.SEMANTIC_CACHE_THRESHOLD if threshold is None else threshold
+        self._vectors: List[List[float]] = []
+        self._values: List[Dict[str, any]] = []
+        self._lock = threading.Lock()
+        self._load()
+
+    @staticmethod
+    def normalize(vector: Sequence[float]) -> List[float]:
+        """Scale a vector to unit length so dot products equal cosine similarity."""
+        norm = math.sqrt(sum(x * x for x in vector))
+        return [x / norm for x in vector] if norm else list(vector)
+
+    def search(self, vector: List[float], bucket: str = DEFAULT_BUCKET) -> Optional[any]:
+        """Return the bucket's value for the most similar stored article if it meets the threshold."""
+        best_score, best_value = -1.0, None
+
+        with self._lock:
+            for stored, values in zip(self._vectors, self._values):
+                if bucket not in values:
+                    continue
+                score = sum(a * b for a, b in zip(vector, stored))
+                if score > best_score:
+                    best_score, best_value = score, values[bucket]
+
+        return best_value if best_score >= self.threshold else None
+
+    def add(self, vector: List[float], value: any, bucket: str = DEFAULT_BUCKET):
+        """Store a value under its article vector and persist the cache."""
+        self.add_many(vector, {bucket: value})
+
+    def add_many(self, vector: List[float], values: Dict[str, any]):
+        """Store several bucket values for one article vector with a single write."""
+        with self._lock:
+            self._vectors.append(vector)
+            self._values.append(values)
+            self._save()
+
+    def _load(self):
+        try:
+            with open(self.path, 'rb') as f:
+                entries = orjson.loads(f.read())
+            self._vectors = [entry['vector'] for entry in entries]
+            self._values = [entry['values'] for entry in entries]
+        except (OSError, ValueError, KeyError, TypeError):
+            self._vectors, self._values = [], []
+
+    def _save(self):
+        entries = [
+            {'vector': vector, 'values': values}
+            for vector, values in zip(self._vectors, self._values)
+        ]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(entries))
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # A cache that cannot be written must never fail the analysis
+            logger.debug("Semantic cache write failed: %s", e)
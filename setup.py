@@ -0,0 +1,24 @@
+"""
+Optional build script that compiles report_generator.py with Cython.
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+The compiled extension is imported in place of report_generator.py; the
+pure-Python module is used unchanged when it has not been built. Pass
+CYTHON_ANNOTATE=1 to also write report_generator.html, which highlights
+the lines that still go through the Python C-API.
+"""
+import os
+
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(
+    name='digital-skeptic-report-generator',
+    ext_modules=cythonize(
+        ['report_generator.py'],
+        language_level=3,
+        annotate=os.getenv('CYTHON_ANNOTATE') == '1',
+    ),
+)
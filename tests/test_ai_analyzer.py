@@ -0,0 +1,203 @@
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import httpx
+import requests
+import tiktoken
+from openai import RateLimitError
+
+import ai_analyzer
+from ai_analyzer import AIAnalysisError, DigitalSkepticAnalyzer
+from config import Config
+
+VALID_ANALYSIS = (
+    '{"core_claims": ["claim"], "language_analysis": "Neutral.", "red_flags": [],'
+    ' "verification_questions": ["question"],'
+    ' "entities": {"people": [], "organizations": [], "locations": []},'
+    ' "counter_argument": "An opposing perspective might argue that..."}'
+)
+
+ARTICLE = {
+    'title': 'Title',
+    'content': 'Article text.',
+    'url': 'https://example.com/story',
+    '_excerpts': {budget: 'Article text.' for budget in ai_analyzer.EXCERPT_BUDGETS},
+}
+
+
+def rate_limit_error(retry_after: str) -> RateLimitError:
+    request = httpx.Request('POST', 'https://api.openai.com/v1/chat/completions')
+    response = httpx.Response(429, headers={'retry-after': retry_after}, request=request)
+    return RateLimitError('Rate limit reached', response=response, body=None)
+
+
+class StubCompletions:
+    """Returns canned (content, finish_reason) replies and counts requests."""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def create(self, **request):
+        reply = self.replies[min(self.calls, len(self.replies) - 1)]
+        self.calls += 1
+        if isinstance(reply, Exception):
+            raise reply
+        content, finish_reason = reply
+        message = SimpleNamespace(content=content)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message, finish_reason=finish_reason)])
+
+
+class AnalyzerTestCase(unittest.TestCase):
+    """Analyzer with a temporary response cache and no network access."""
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        for name, value in {
+            'OPENAI_API_KEY': 'test-key',
+            'LLM_CACHE_ENABLED': True,
+            'LLM_CACHE_DIR': cache_dir.name,
+            'SEMANTIC_CACHE_ENABLED': False,
+            'TASK_CACHE_ENABLED': False,
+        }.items():
+            patcher = mock.patch.object(Config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        # Behave like an offline machine with no BPE file in the tiktoken cache
+        patcher = mock.patch.object(
+            ai_analyzer.tiktoken, 'encoding_for_model',
+            side_effect=requests.exceptions.ConnectionError('offline')
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        ai_analyzer._get_encoding.cache_clear()
+        self.addCleanup(ai_analyzer._get_encoding.cache_clear)
+
+        self.analyzer = DigitalSkepticAnalyzer()
+
+    def use_replies(self, *replies) -> StubCompletions:
+        completions = StubCompletions(*replies)
+        self.analyzer.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+        return completions
+
+
+class TokenizerFallbackTest(AnalyzerTestCase):
+
+    def test_excerpts_fall_back_to_character_slices(self):
+        content = 'x' * 10000
+
+        excerpts = self.analyzer._build_excerpts(content)
+
+        self.assertIsNone(self.analyzer._encoding)
+        self.assertEqual(
+            {budget: len(excerpt) for budget, excerpt in excerpts.items()},
+            {budget: budget * 4 for budget in ai_analyzer.EXCERPT_BUDGETS}
+        )
+
+
+class TokenizerExcerptTest(AnalyzerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Byte-level encoding with a special token, built locally so no BPE
+        # file has to be downloaded
+        self.analyzer._encoding = tiktoken.Encoding(
+            'test_bytes',
+            pat_str=r'\S+|\s+',
+            mergeable_ranks={bytes([i]): i for i in range(256)},
+            special_tokens={'<|endoftext|>': 256}
+        )
+
+    def test_excerpts_trim_to_token_budget(self):
+        excerpts = self.analyzer._build_excerpts('x' * 10000)
+
+        self.assertEqual(
+            {budget: len(excerpt) for budget, excerpt in excerpts.items()},
+            {budget: budget for budget in ai_analyzer.EXCERPT_BUDGETS}
+        )
+
+    def test_special_token_text_is_encoded_as_plain_text(self):
+        content = 'Models stop at <|endoftext|> markers.'
+
+        excerpts = self.analyzer._build_excerpts(content)
+
+        self.assertEqual(set(excerpts.values()), {content})
+
+
+class EmbeddingTest(AnalyzerTestCase):
+
+    def test_batch_analysis_skips_embedding_for_task_cache(self):
+        self.analyzer.task_cache = mock.Mock()
+        self.use_replies((VALID_ANALYSIS, 'stop'))
+
+        with mock.patch.object(Config, 'BATCH_ANALYSIS', True), \
+                mock.patch.object(self.analyzer, '_embed_article') as embed:
+            self.analyzer.analyze_article(ARTICLE)
+
+        embed.assert_not_called()
+        self.analyzer.task_cache.search.assert_not_called()
+
+
+class RetryTest(AnalyzerTestCase):
+
+    def test_retry_waits_for_server_retry_after(self):
+        completions = self.use_replies(rate_limit_error('5'), ('Answer', 'stop'))
+
+        with mock.patch.object(ai_analyzer.time, 'sleep') as sleep:
+            self.assertEqual(self.analyzer._get_ai_response('prompt'), 'Answer')
+
+        self.assertEqual(completions.calls, 2)
+        self.assertGreaterEqual(sleep.call_args.args[0], 5)
+
+    def test_retry_after_is_capped_at_max_delay(self):
+        self.use_replies(rate_limit_error('3600'), ('Answer', 'stop'))
+
+        with mock.patch.object(ai_analyzer.time, 'sleep') as sleep:
+            self.analyzer._get_ai_response('prompt')
+
+        self.assertLessEqual(sleep.call_args.args[0], Config.RETRY_MAX_DELAY + 0.5)
+
+
+class ResponseCacheTest(AnalyzerTestCase):
+
+    def test_truncated_json_is_not_cached(self):
+        completions = self.use_replies(('{"core_claims": ["cla', 'length'), (VALID_ANALYSIS, 'stop'))
+
+        with self.assertRaisesRegex(AIAnalysisError, 'invalid JSON'):
+            self.analyzer._analyze_all(ARTICLE)
+
+        self.assertEqual(self.analyzer._analyze_all(ARTICLE)['core_claims'], ['claim'])
+        self.assertEqual(completions.calls, 2)
+
+    def test_invalid_json_is_not_cached(self):
+        completions = self.use_replies(('not json', 'stop'), (VALID_ANALYSIS, 'stop'))
+
+        with self.assertRaises(AIAnalysisError):
+            self.analyzer._analyze_all(ARTICLE)
+
+        self.assertEqual(self.analyzer._analyze_all(ARTICLE)['red_flags'], [])
+        self.assertEqual(completions.calls, 2)
+
+    def test_length_limited_text_is_not_cached(self):
+        completions = self.use_replies(('Partial answer', 'length'), ('Full answer', 'stop'))
+
+        self.assertEqual(self.analyzer._get_ai_response('prompt'), 'Partial answer')
+        self.assertEqual(self.analyzer._get_ai_response('prompt'), 'Full answer')
+        self.assertEqual(completions.calls, 2)
+
+    def test_complete_response_is_cached(self):
+        completions = self.use_replies((VALID_ANALYSIS, 'stop'))
+
+        first = self.analyzer._analyze_all(ARTICLE)
+        second = self.analyzer._analyze_all(ARTICLE)
+
+        self.assertEqual(first, second)
+        self.assertEqual(completions.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
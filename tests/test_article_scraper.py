@@ -0,0 +1,23 @@
+import unittest
+from unittest import mock
+
+from urllib3.response import HTTPResponse
+
+import article_scraper
+
+
+class SessionRetryTest(unittest.TestCase):
+
+    def test_retry_after_header_does_not_extend_backoff(self):
+        retry = article_scraper._get_session().get_adapter('https://example.com').max_retries
+        response = HTTPResponse(status=503, headers={'Retry-After': '3600'}, preload_content=False)
+        retry = retry.increment(method='GET', url='/', response=response)
+
+        with mock.patch('urllib3.util.retry.time.sleep') as sleep:
+            retry.sleep(response)
+
+        self.assertTrue(all(call.args[0] < 60 for call in sleep.call_args_list))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,56 @@
+import io
+import unittest
+from unittest import mock
+
+import report_generator
+from report_generator import ReportGenerator
+
+FULL_RESULTS = {
+    'core_claims': ['The council approved the budget.'],
+    'language_analysis': 'The tone is neutral.',
+    'red_flags': ['Anonymous sourcing'],
+    'verification_questions': ['Who voted against the budget?'],
+    'entities': {'people': ['Jane Doe - mayor'], 'organizations': [], 'locations': ['Springfield']},
+    'counter_argument': 'An opposing perspective might argue that...',
+    'article_metadata': {'title': 'Budget vote', 'url': 'https://example.com', 'authors': 'A. Writer',
+                         'publish_date': '2024-01-01'},
+}
+
+EMPTY_RESULTS = {
+    'core_claims': [],
+    'language_analysis': '',
+    'red_flags': [],
+    'verification_questions': [],
+    'entities': {'people': [], 'organizations': [], 'locations': []},
+    'counter_argument': '',
+    'article_metadata': {'title': 'Untitled', 'url': '', 'authors': None, 'publish_date': None},
+}
+
+
+class WriteReportTest(unittest.TestCase):
+
+    def setUp(self):
+        # Pin the header timestamp so a minute rollover between calls cannot differ
+        patcher = mock.patch.object(report_generator, '_report_timestamp', return_value='January 02, 2024 at 03:04 AM')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_write_report_matches_generate_report(self):
+        generator = ReportGenerator()
+
+        for results in (FULL_RESULTS, EMPTY_RESULTS, {}):
+            with self.subTest(results=results):
+                stream = io.StringIO()
+                generator.write_report(results, stream)
+                self.assertEqual(stream.getvalue(), generator.generate_report(results))
+
+    def test_absent_optional_sections_leave_no_blank_runs(self):
+        report = ReportGenerator().generate_report(EMPTY_RESULTS)
+
+        self.assertNotIn('\n\n\n', report)
+        self.assertNotIn('Entity Investigation Guide', report)
+        self.assertNotIn('Alternative Perspective', report)
+
+
+if __name__ == '__main__':
+    unittest.main()